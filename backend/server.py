@@ -1,5 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, Body, Query, Request, File, UploadFile
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -174,10 +174,11 @@ def geohash(lat: float, lon: float, precision: int = 6) -> str:
 
 # Import services
 from services import (
-    firebase_service,
-    paystack_service,
-    expo_push_service,
-    email_service
+    get_firebase_service,
+    get_paystack_service,
+    get_expo_push_service,
+    get_email_service,
+    PaystackError
 )
 
 # Real Push Notification using Expo
@@ -197,7 +198,7 @@ async def send_push_notification(user_ids: List[str], title: str, body: str, dat
             return {"status": "no_tokens", "sent_to": 0}
         
         # Send via Expo Push Service
-        result = await expo_push_service.send_push_notification(
+        result = await get_expo_push_service().send_push_notification(
             tokens=tokens,
             title=title,
             body=body,
@@ -501,15 +502,13 @@ async def activate_panic(panic_data: LocationPoint, user = Depends(get_current_u
                 '_id': {'$in': [ObjectId(uid) for uid in security_user_ids]}
             }).to_list(length=None)
             
-            for sec_user in security_users:
-                if sec_user.get('email'):
-                    await email_service.send_panic_alert_email(
-                        to_email=sec_user['email'],
-                        reporter_name=user.get('email', 'Unknown'),
-                        latitude=panic_data.latitude,
-                        longitude=panic_data.longitude,
-                        timestamp=datetime.utcnow()
-                    )
+            await get_email_service().send_panic_alert_emails(
+                to_emails=[u['email'] for u in security_users if u.get('email')],
+                reporter_name=user.get('email', 'Unknown'),
+                latitude=panic_data.latitude,
+                longitude=panic_data.longitude,
+                timestamp=datetime.utcnow()
+            )
         except Exception as e:
             logging.error(f"Error sending panic emails: {e}")
     
@@ -680,18 +679,14 @@ async def upload_video_report(video: VideoUpload, user = Depends(get_current_use
         raise HTTPException(status_code=403, detail="Only civil users can create reports")
     
     try:
-        import base64
         import uuid
         
-        # Decode base64 video data
-        video_bytes = base64.b64decode(video.video_data)
-        
         # Generate unique filename
         filename = f"video_{str(user['_id'])}_{uuid.uuid4().hex[:8]}.mp4"
         
-        # Try to upload to Firebase Storage
-        file_url = await firebase_service.upload_file(
-            video_bytes,
+        # Decode base64 video data and upload to Firebase Storage
+        file_url = await get_firebase_service().upload_base64(
+            video.video_data,
             filename,
             'video/mp4',
             'videos'
@@ -1128,7 +1123,7 @@ async def register_push_token(token: str = Body(...), user = Depends(get_current
     """Register Expo push token for user"""
     try:
         # Validate token format
-        if not expo_push_service.is_valid_token(token):
+        if not get_expo_push_service().is_valid_token(token):
             raise HTTPException(status_code=400, detail="Invalid Expo push token format")
         
         # Update user's push token
@@ -1172,7 +1167,7 @@ async def init_payment(amount: float = Body(...), user = Depends(get_current_use
         amount_in_kobo = int(amount * 100)
         
         # Initialize payment with Paystack
-        result = await paystack_service.initialize_transaction(
+        result = await get_paystack_service().initialize_transaction(
             email=user['email'],
             amount=amount_in_kobo,
             reference=reference,
@@ -1202,6 +1197,8 @@ async def init_payment(amount: float = Body(...), user = Depends(get_current_use
         else:
             raise HTTPException(status_code=400, detail="Payment initialization failed")
             
+    except (HTTPException, PaystackError):
+        raise
     except Exception as e:
         logging.error(f"Payment init error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1211,7 +1208,7 @@ async def verify_payment(reference: str, user = Depends(get_current_user)):
     """Verify Paystack payment and activate premium"""
     try:
         # Verify payment with Paystack
-        result = await paystack_service.verify_transaction(reference)
+        result = await get_paystack_service().verify_transaction(reference)
         
         if result.get('status'):
             data = result.get('data', {})
@@ -1238,7 +1235,7 @@ async def verify_payment(reference: str, user = Depends(get_current_user)):
                 
                 # Send confirmation email
                 try:
-                    await email_service.send_payment_confirmation(
+                    await get_email_service().send_payment_confirmation(
                         to_email=user['email'],
                         amount=data.get('amount', 0) / 100,  # Convert from kobo
                         reference=reference
@@ -1260,6 +1257,8 @@ async def verify_payment(reference: str, user = Depends(get_current_user)):
         else:
             raise HTTPException(status_code=400, detail="Payment verification failed")
             
+    except (HTTPException, PaystackError):
+        raise
     except Exception as e:
         logging.error(f"Payment verification error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1287,7 +1286,7 @@ async def verify_payment_post(data: PaymentVerify, user = Depends(get_current_us
             }
         
         # Otherwise try to verify with Paystack
-        result = await paystack_service.verify_transaction(data.reference)
+        result = await get_paystack_service().verify_transaction(data.reference)
         
         if result.get('status') and result.get('data', {}).get('status') == 'success':
             await db.users.update_one(
@@ -1305,7 +1304,7 @@ async def verify_payment_post(data: PaymentVerify, user = Depends(get_current_us
         else:
             raise HTTPException(status_code=400, detail="Payment verification failed")
             
-    except HTTPException:
+    except (HTTPException, PaystackError):
         raise
     except Exception as e:
         logging.error(f"Payment verification error: {e}")
@@ -1895,7 +1894,7 @@ async def admin_broadcast(
     sent = 0
     for i in range(0, len(push_tokens), 100):
         batch = push_tokens[i:i+100]
-        result = await push_service.send_push_notification(batch, title, message, {'type': 'broadcast'})
+        result = await get_expo_push_service().send_push_notification(batch, title, message, {'type': 'broadcast'})
         sent += result.get('sent_to', 0)
     
     await _log_admin_action(str(user['_id']), 'broadcast', 'all', 'all', {
@@ -2633,7 +2632,7 @@ async def admin_send_message(
         # Send push notification
         target_user = await db.users.find_one({'_id': ObjectId(to_user_id)})
         if target_user and target_user.get('push_token'):
-            await push_service.send_push_notification(
+            await get_expo_push_service().send_push_notification(
                 [target_user['push_token']],
                 "Message from Admin",
                 content[:100],
@@ -2799,6 +2798,10 @@ async def get_escort_eta_alerts(user = Depends(get_current_user)):
     return result
 
 
+@app.exception_handler(PaystackError)
+async def paystack_error_handler(request: Request, exc: PaystackError):
+    return JSONResponse(status_code=exc.status, content={'detail': exc.detail})
+
 # Include router
 app.include_router(api_router)
 
@@ -2862,4 +2865,7 @@ async def create_default_invite_codes():
 
 @app.on_event("shutdown")
 async def shutdown():
+    await get_firebase_service().flush()
+    await get_expo_push_service().aclose()
+    await get_email_service().aclose()
     client.close()
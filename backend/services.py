@@ -4,25 +4,172 @@ Integration services - Simplified version without external dependencies
 import os
 import logging
 import base64
+import binascii
+import copy
+import functools
+import html
+import re
+import time
+import asyncio
+from string import Template
+from collections import deque
+from dataclasses import dataclass, field
 import httpx
+import orjson
+import aiosmtplib
+from cachetools import TTLCache
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from dotenv import load_dotenv
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent
-load_dotenv(ROOT_DIR / '.env')
+if not os.getenv('NO_DOTENV'):
+    load_dotenv(ROOT_DIR / '.env')
 
 logger = logging.getLogger(__name__)
 
+_FINAL_PAYMENT_STATUSES = ('success', 'failed', 'abandoned')
+_VERIFY_FIELDS = ('status', 'reference', 'amount', 'currency', 'paid_at')
+
+_RETRY_STATUSES = (429, 502, 503, 504)
+
+_VALID_TOKEN = re.compile(r'\AExponentPushToken\[[^\]]+\]\Z').match
+
+# ===== EMAIL TEMPLATES =====
+_PANIC_TEXT = Template("""
+EMERGENCY ALERT!
+
+User: $user_name
+Phone: $user_phone
+Category: $category
+Location: $lat, $lng
+Map: https://maps.google.com/?q=$lat,$lng
+
+Please respond immediately!
+""")
+
+_PANIC_ALERT_TEXT = Template("""
+EMERGENCY ALERT!
+
+Reported by: $reporter
+Time: $ts
+Location: $lat, $lng
+Map: https://maps.google.com/?q=$lat,$lng
+
+Please respond immediately!
+""")
+
+_PANIC_ALERT_HTML = Template("""\
+<html>
+  <body style="font-family: Arial, sans-serif;">
+    <h2 style="color: #d32f2f;">&#128680; EMERGENCY ALERT</h2>
+    <p><strong>Reported by:</strong> $reporter</p>
+    <p><strong>Time:</strong> $ts</p>
+    <p><strong>Location:</strong> $lat, $lng</p>
+    <p><a href="https://maps.google.com/?q=$lat,$lng">View on map</a></p>
+    <p>Please respond immediately!</p>
+  </body>
+</html>
+""")
+
+_PAYMENT_TEXT = Template("""
+Payment received - thank you!
+
+Amount: NGN $amount
+Reference: $reference
+
+Your SafeGuard premium subscription is now active.
+""")
+
+_PAYMENT_HTML = Template("""\
+<html>
+  <body style="font-family: Arial, sans-serif;">
+    <h2 style="color: #2e7d32;">Payment received - thank you!</h2>
+    <p><strong>Amount:</strong> NGN $amount</p>
+    <p><strong>Reference:</strong> $reference</p>
+    <p>Your SafeGuard premium subscription is now active.</p>
+  </body>
+</html>
+""")
+
 # ===== FIREBASE STORAGE SERVICE (MOCK) =====
 class FirebaseStorageService:
     """Mock Firebase Storage Service - stores files locally"""
     def __init__(self):
         self.bucket_name = os.getenv('FIREBASE_STORAGE_BUCKET', 'safeguard-storage')
         self.storage_dir = ROOT_DIR / 'uploads'
+        self.initialized = False
+        self._init_lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._folders: set = set()
+        # Back-pressure so a burst of uploads can't queue unbounded bytes
+        self._slots = asyncio.Semaphore(32)
+        self._bytes_inflight = 0
+        self._bytes_cap = 512 * 1024 * 1024
+        self._bytes_freed = asyncio.Event()
+    
+    def _do_init_sync(self) -> bool:
         self.storage_dir.mkdir(exist_ok=True)
+        self.initialized = True
         logger.info(f"Firebase Storage service (local mock) initialized")
+        return True
+    
+    async def _lazy_init(self) -> bool:
+        """Prepare storage on first use, once, off the event loop"""
+        if self.initialized:
+            return True
+        async with self._init_lock:
+            if self.initialized:
+                return True
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._do_init_sync)
+    
+    def _write_with_retry(self, file_path: Path, file_data: bytes):
+        """Write file to disk, retrying with exponential backoff"""
+        # Write to a temp name first so the media route never serves a partial file
+        tmp_path = file_path.with_name(file_path.name + '.part')
+        for attempt in range(3):
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(file_data)
+                os.replace(tmp_path, file_path)
+                return
+            except OSError as e:
+                if attempt == 2:
+                    raise
+                logger.warning(f"Upload write failed ({e}), retrying")
+                time.sleep(2 ** attempt)
+    
+    async def _reserve(self, size: int):
+        """Wait for a free upload slot and room for size bytes"""
+        await self._slots.acquire()
+        try:
+            # A file larger than the cap is let through once nothing else is queued
+            while self._bytes_inflight and self._bytes_inflight + size > self._bytes_cap:
+                self._bytes_freed.clear()
+                await self._bytes_freed.wait()
+        except BaseException:
+            # Cancelled while waiting, give the slot back
+            self._slots.release()
+            raise
+        self._bytes_inflight += size
+    
+    def _release(self, size: int):
+        self._bytes_inflight -= size
+        self._bytes_freed.set()
+        self._slots.release()
+    
+    def _upload_done(self, key: str, size: int, fut: asyncio.Future):
+        self._release(size)
+        if self._pending.get(key) is fut:
+            del self._pending[key]
+        if not fut.cancelled() and fut.exception() is not None:
+            logger.error(f"Upload error: {fut.exception()}")
     
     async def upload_file(
         self, 
@@ -31,21 +178,57 @@ class FirebaseStorageService:
         content_type: str = 'application/octet-stream',
         folder: str = 'uploads'
     ) -> str:
-        """Upload file locally and return a URL path"""
+        """Queue file for background write and return its URL path immediately"""
+        url = f"/api/media/{folder}/{filename}"
         try:
+            await self._lazy_init()
             folder_path = self.storage_dir / folder
-            folder_path.mkdir(exist_ok=True)
+            if folder not in self._folders:
+                folder_path.mkdir(exist_ok=True)
+                self._folders.add(folder)
             
-            file_path = folder_path / filename
-            with open(file_path, 'wb') as f:
-                f.write(file_data)
+            size = len(file_data)
+            await self._reserve(size)
+            loop = asyncio.get_running_loop()
+            try:
+                fut = loop.run_in_executor(
+                    self._executor, self._write_with_retry, folder_path / filename, file_data
+                )
+            except Exception:
+                self._release(size)
+                raise
+            key = f"{folder}/{filename}"
+            self._pending[key] = fut
+            fut.add_done_callback(lambda f: self._upload_done(key, size, f))
             
             # Return path that can be served by the backend
-            return f"/api/media/{folder}/{filename}"
+            return url
             
         except Exception as e:
             logger.error(f"Upload error: {e}")
-            return f"/api/media/{folder}/{filename}"
+            return url
+    
+    async def flush(self):
+        """Wait for all queued uploads to finish"""
+        if self._pending:
+            await asyncio.gather(*self._pending.values(), return_exceptions=True)
+    
+    @staticmethod
+    def _decode_base64(base64_data: str) -> memoryview:
+        """Decode base64 in chunks into one preallocated buffer"""
+        step = 4 * 64 * 1024  # multiple of 4 so chunks decode independently
+        buf = bytearray(len(base64_data) * 3 // 4)
+        mv = memoryview(buf)
+        off = 0
+        try:
+            for i in range(0, len(base64_data), step):
+                chunk = base64.b64decode(base64_data[i:i + step], validate=True)
+                mv[off:off + len(chunk)] = chunk
+                off += len(chunk)
+        except binascii.Error:
+            # Whitespace or line breaks shift chunk boundaries, decode in one go
+            return memoryview(base64.b64decode(base64_data))
+        return mv[:off]
     
     async def upload_base64(
         self,
@@ -54,17 +237,14 @@ class FirebaseStorageService:
         content_type: str,
         folder: str = 'uploads'
     ) -> str:
-        """Upload base64 encoded file"""
-        try:
-            file_data = base64.b64decode(base64_data)
-            return await self.upload_file(file_data, filename, content_type, folder)
-        except Exception as e:
-            logger.error(f"Base64 upload error: {e}")
-            return f"/api/media/{folder}/{filename}"
+        """Upload base64 encoded file, decode errors are raised to the caller"""
+        file_data = self._decode_base64(base64_data)
+        return await self.upload_file(file_data, filename, content_type, folder)
     
     async def delete_file(self, file_path: str) -> bool:
         """Delete a file"""
         try:
+            await self._lazy_init()
             parts = file_path.split('/')
             if len(parts) >= 2:
                 full_path = self.storage_dir / parts[-2] / parts[-1]
@@ -77,10 +257,21 @@ class FirebaseStorageService:
             return False
 
 # ===== PAYSTACK SERVICE (MOCK) =====
+class PaystackError(Exception):
+    """Paystack request rejected, carries the HTTP status to return"""
+    __slots__ = ('status', 'detail')
+    
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
 class PaystackService:
     """Mock Paystack payment service"""
     def __init__(self):
         self.secret_key = os.getenv('PAYSTACK_SECRET_KEY', 'sk_test_mock')
+        self._verify_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        self._verify_inflight: Dict[str, asyncio.Future] = {}
         logger.info("Paystack service (mock) initialized")
     
     async def initialize_transaction(
@@ -92,6 +283,8 @@ class PaystackService:
         metadata: dict = None
     ) -> dict:
         """Initialize a mock payment transaction"""
+        if amount <= 0:
+            raise PaystackError(400, "Amount must be greater than zero")
         return {
             "status": True,
             "message": "Authorization URL created",
@@ -103,6 +296,35 @@ class PaystackService:
         }
     
     async def verify_transaction(self, reference: str) -> dict:
+        """Verify a transaction, sharing one lookup between concurrent callers"""
+        if not reference:
+            raise PaystackError(400, "Transaction reference is required")
+        cached = self._verify_cache.get(reference)
+        if cached is not None:
+            return cached
+        
+        task = self._verify_inflight.get(reference)
+        if task is None:
+            task = asyncio.ensure_future(self._verify_and_cache(reference))
+            self._verify_inflight[reference] = task
+            task.add_done_callback(lambda _: self._verify_inflight.pop(reference, None))
+        return await asyncio.shield(task)
+    
+    async def _verify_and_cache(self, reference: str) -> dict:
+        result = await self._fetch_verification(reference)
+        # Keep only the fields callers read so cached entries stay small
+        data = result.get('data') or {}
+        result = {
+            'status': result.get('status'),
+            'message': result.get('message'),
+            'data': {k: data[k] for k in _VERIFY_FIELDS if k in data}
+        }
+        # Only final states are cached, pending payments must be re-checked
+        if result.get('status') and result.get('data', {}).get('status') in _FINAL_PAYMENT_STATUSES:
+            self._verify_cache[reference] = result
+        return result
+    
+    async def _fetch_verification(self, reference: str) -> dict:
         """Verify a mock transaction"""
         return {
             "status": True,
@@ -116,67 +338,218 @@ class PaystackService:
         }
 
 # ===== EXPO PUSH SERVICE =====
+@dataclass(slots=True)
+class PushResults:
+    """Running totals for a push send"""
+    success: int = 0
+    failed: int = 0
+    errors: deque = field(default_factory=lambda: deque(maxlen=1000))
+    tickets: list = field(default_factory=list)
+    status: Optional[str] = None  # overrides the sent/error status
+    
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status or ("sent" if self.success else "error"),
+            "sent_to": self.success,
+            "success": self.success,
+            "failed": self.failed,
+            "errors": list(self.errors),
+            "tickets": self.tickets
+        }
+
 class ExpoPushService:
     """Expo push notification service"""
     def __init__(self):
         self.push_url = "https://exp.host/--/api/v2/push/send"
+        self.client: Optional[httpx.AsyncClient] = None
         logger.info("Expo Push service initialized")
     
+    async def _client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self.client is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                retries=3  # connection errors only, status retries are in _send
+            )
+            self.client = httpx.AsyncClient(
+                transport=transport,
+                headers={"Content-Type": "application/json"},
+                timeout=30.0
+            )
+        return self.client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def _post(self, client: httpx.AsyncClient, payload: Any) -> Any:
+        """POST to Expo, retrying throttled or unavailable responses"""
+        content = orjson.dumps(payload)
+        for attempt in range(4):
+            response = await client.post(self.push_url, content=content)
+            if response.status_code not in _RETRY_STATUSES or attempt == 3:
+                break
+            await asyncio.sleep(0.5 * 2 ** attempt)
+        if response.status_code != 200:
+            raise RuntimeError(response.text)
+        return orjson.loads(response.content).get('data', [])
+    
+    @staticmethod
+    def is_valid_token(token: str) -> bool:
+        """Check that a token looks like an Expo push token"""
+        return bool(token) and _VALID_TOKEN(token) is not None
+    
     async def send_push_notification(
         self,
         tokens: List[str],
         title: str,
         body: str,
-        data: dict = None
+        data: dict = None,
+        priority: str = 'high',
+        collect_tickets: bool = False
     ) -> dict:
-        """Send push notification via Expo"""
+        """Send push notification via Expo, per-ticket details only if collect_tickets"""
         try:
             if not tokens:
-                return {"status": "no_tokens", "sent_to": 0}
+                return PushResults(status="no_tokens").to_dict()
+            
+            # Fields shared by every message, copied per token below
+            template = {
+                "title": title,
+                "body": body,
+                "data": data or {},
+                "sound": "default",
+                "priority": priority
+            }
             
-            messages = []
-            for token in tokens:
-                if token and token.startswith('ExponentPushToken'):
-                    messages.append({
-                        "to": token,
-                        "title": title,
-                        "body": body,
-                        "data": data or {},
-                        "sound": "default",
-                        "priority": "high"
-                    })
+            # Most notifications target one device, skip batching for that case
+            if len(tokens) == 1:
+                token = tokens[0]
+                if not self.is_valid_token(token):
+                    return PushResults(
+                        status="no_valid_tokens", failed=1,
+                        errors=deque(["Invalid Expo push token"], maxlen=1000)
+                    ).to_dict()
+                client = await self._client()
+                ticket = await self._post(client, {**template, "to": token})
+                ok = ticket.get('status') == 'ok'
+                return {
+                    "status": "sent" if ok else "error",
+                    "sent_to": int(ok),
+                    "success": int(ok),
+                    "failed": int(not ok),
+                    "errors": [] if ok else [ticket.get('message')],
+                    "tickets": [ticket] if collect_tickets else []
+                }
+            
+            messages = [{**template, "to": token} for token in tokens if token and _VALID_TOKEN(token)]
             
             if not messages:
-                return {"status": "no_valid_tokens", "sent_to": 0}
+                return PushResults(status="no_valid_tokens", failed=len(tokens)).to_dict()
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.push_url,
-                    json=messages,
-                    headers={"Content-Type": "application/json"},
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    return {"status": "sent", "sent_to": len(messages)}
-                else:
-                    logger.error(f"Push notification error: {response.text}")
-                    return {"status": "error", "sent_to": 0}
+            # Expo accepts at most 100 messages per request
+            batches = [messages[i:i + 100] for i in range(0, len(messages), 100)]
+            client = await self._client()
+            sem = asyncio.Semaphore(5)
+            
+            async def _send(batch: List[dict]) -> List[dict]:
+                async with sem:
+                    return await self._post(client, batch)
+            
+            ticket_lists = await asyncio.gather(
+                *[_send(batch) for batch in batches], return_exceptions=True
+            )
+            
+            results = PushResults()
+            for batch, tickets in zip(batches, ticket_lists):
+                if isinstance(tickets, Exception):
+                    logger.error(f"Push notification error: {tickets}")
+                    results.failed += len(batch)
+                    results.errors.append(str(tickets))
+                    continue
+                if collect_tickets:
+                    results.tickets.extend(tickets)
+                for ticket in tickets:
+                    if ticket.get('status') == 'ok':
+                        results.success += 1
+                    else:
+                        results.failed += 1
+                        results.errors.append(ticket.get('message'))
+            
+            return results.to_dict()
                     
         except Exception as e:
             logger.error(f"Push notification error: {e}")
-            return {"status": "error", "error": str(e), "sent_to": 0}
+            results = PushResults(failed=len(tokens or []))
+            results.errors.append(str(e))
+            return {**results.to_dict(), "error": str(e)}
 
-# ===== EMAIL SERVICE (MOCK) =====
+# ===== EMAIL SERVICE =====
 class EmailService:
-    """Mock email service"""
+    """Email service - sends over SMTP when configured, otherwise just logs"""
     def __init__(self):
         self.smtp_host = os.getenv('SMTP_HOST', 'smtp.gmail.com')
         self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
         self.smtp_user = os.getenv('SMTP_USER', '')
         self.smtp_pass = os.getenv('SMTP_PASSWORD', '')
         self.from_email = os.getenv('FROM_EMAIL', 'noreply@safeguard.app')
-        logger.info("Email service (mock) initialized")
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._lock = asyncio.Lock()
+        logger.info("Email service initialized")
+    
+    async def _get_smtp(self) -> aiosmtplib.SMTP:
+        """Return the shared SMTP connection, reconnecting if it was dropped"""
+        async with self._lock:
+            if self._smtp is None or not self._smtp.is_connected:
+                smtp = aiosmtplib.SMTP(
+                    hostname=self.smtp_host,
+                    port=self.smtp_port,
+                    use_tls=self.smtp_port == 465
+                )
+                try:
+                    await smtp.connect()
+                    await smtp.login(self.smtp_user, self.smtp_pass)
+                except BaseException:
+                    # A rejected login leaves the socket open, don't keep it around
+                    smtp.close()
+                    raise
+                self._smtp = smtp
+            return self._smtp
+    
+    async def _send_message(self, message: MIMEMultipart):
+        for attempt in range(2):
+            smtp = await self._get_smtp()
+            try:
+                async with self._lock:
+                    await smtp.send_message(message)
+                return
+            except aiosmtplib.SMTPServerDisconnected:
+                if attempt:
+                    raise
+                logger.warning("SMTP connection dropped, reconnecting")
+    
+    def _build_message(self, subject: str, body: str, html_body: Optional[str], to_email: str) -> MIMEMultipart:
+        message = MIMEMultipart('alternative')
+        message['From'] = self.from_email
+        message['To'] = to_email
+        message['Subject'] = subject
+        message.attach(MIMEText(body, 'plain'))
+        if html_body:
+            message.attach(MIMEText(html_body, 'html'))
+        return message
+    
+    async def aclose(self):
+        """Close the shared SMTP connection"""
+        if self._smtp is not None and self._smtp.is_connected:
+            try:
+                await self._smtp.quit()
+            except Exception as e:
+                logger.warning(f"SMTP quit failed ({e}), closing connection")
+                self._smtp.close()
+        self._smtp = None
     
     async def send_email(
         self,
@@ -185,14 +558,49 @@ class EmailService:
         body: str,
         html_body: str = None
     ) -> bool:
-        """Send an email (mock - just logs)"""
+        """Send an email (logs only when SMTP credentials are not set)"""
         try:
-            logger.info(f"[EMAIL MOCK] To: {to_email}, Subject: {subject}")
+            if not self.smtp_user:
+                logger.info(f"[EMAIL MOCK] To: {to_email}, Subject: {subject}")
+                return True
+            
+            await self._send_message(self._build_message(subject, body, html_body, to_email))
             return True
         except Exception as e:
             logger.error(f"Email error: {e}")
             return False
     
+    async def send_bulk(
+        self,
+        recipients: List[str],
+        subject: str,
+        body: str,
+        html_body: str = None
+    ) -> int:
+        """Send the same email to many recipients, returns number sent"""
+        if not recipients:
+            return 0
+        if not self.smtp_user:
+            for to_email in recipients:
+                logger.info(f"[EMAIL MOCK] To: {to_email}, Subject: {subject}")
+            return len(recipients)
+        
+        base = self._build_message(subject, body, html_body, recipients[0])
+        
+        # One shared SMTP connection, so recipients are sent one after another
+        sent = 0
+        for to_email in recipients:
+            # Deleting the header gives the copy its own header list
+            message = copy.copy(base)
+            del message['To']
+            message['To'] = to_email
+            try:
+                await self._send_message(message)
+                sent += 1
+            except Exception as e:
+                logger.error(f"Email error ({to_email}): {e}")
+        return sent
+    
     async def send_panic_alert(
         self,
         to_email: str,
@@ -204,21 +612,93 @@ class EmailService:
     ) -> bool:
         """Send panic alert email"""
         subject = f"🚨 PANIC ALERT - {user_name}"
-        body = f"""
-EMERGENCY ALERT!
+        body = _PANIC_TEXT.substitute(
+            user_name=user_name, user_phone=user_phone, category=category,
+            lat=latitude, lng=longitude
+        )
+        return await self.send_email(to_email, subject, body)
+    
+    async def send_panic_alert_email(
+        self,
+        to_email: str,
+        reporter_name: str,
+        latitude: float,
+        longitude: float,
+        timestamp: datetime
+    ) -> bool:
+        """Send panic alert email with HTML body"""
+        return await self.send_email(
+            to_email, *self._render_panic_alert(reporter_name, latitude, longitude, timestamp)
+        )
+    
+    async def send_panic_alert_emails(
+        self,
+        to_emails: List[str],
+        reporter_name: str,
+        latitude: float,
+        longitude: float,
+        timestamp: datetime
+    ) -> int:
+        """Send one panic alert to many recipients, rendered once"""
+        return await self.send_bulk(
+            to_emails, *self._render_panic_alert(reporter_name, latitude, longitude, timestamp)
+        )
+    
+    @staticmethod
+    def _render_panic_alert(reporter_name: str, latitude: float, longitude: float, timestamp: datetime):
+        """Return (subject, text, html) for a panic alert"""
+        fields = {
+            'reporter': reporter_name,
+            'lat': latitude,
+            'lng': longitude,
+            'ts': timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')
+        }
+        return (
+            f"🚨 PANIC ALERT - {reporter_name}",
+            _PANIC_ALERT_TEXT.substitute(fields),
+            _PANIC_ALERT_HTML.substitute(fields, reporter=html.escape(reporter_name))
+        )
+    
+    async def send_payment_confirmation(
+        self,
+        to_email: str,
+        amount: float,
+        reference: str
+    ) -> bool:
+        """Send premium payment confirmation email"""
+        fields = {'amount': f"{amount:,.2f}", 'reference': reference}
+        return await self.send_email(
+            to_email, "SafeGuard Premium - Payment Confirmed",
+            _PAYMENT_TEXT.substitute(fields),
+            _PAYMENT_HTML.substitute(fields, reference=html.escape(reference))
+        )
 
-User: {user_name}
-Phone: {user_phone}
-Category: {category}
-Location: {latitude}, {longitude}
-Map: https://maps.google.com/?q={latitude},{longitude}
+# Service instances are created on first use
+@functools.cache
+def get_firebase_service() -> FirebaseStorageService:
+    return FirebaseStorageService()
 
-Please respond immediately!
-"""
-        return await self.send_email(to_email, subject, body)
+@functools.cache
+def get_paystack_service() -> PaystackService:
+    return PaystackService()
+
+@functools.cache
+def get_expo_push_service() -> ExpoPushService:
+    return ExpoPushService()
+
+@functools.cache
+def get_email_service() -> EmailService:
+    return EmailService()
+
+_LAZY_SERVICES = {
+    'firebase_service': get_firebase_service,
+    'paystack_service': get_paystack_service,
+    'expo_push_service': get_expo_push_service,
+    'email_service': get_email_service,
+}
 
-# Initialize service instances
-firebase_service = FirebaseStorageService()
-paystack_service = PaystackService()
-expo_push_service = ExpoPushService()
-email_service = EmailService()
+def __getattr__(name: str):
+    # Keep the old module-level names importable
+    if name in _LAZY_SERVICES:
+        return _LAZY_SERVICES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")